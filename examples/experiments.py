@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from lazympl.figure import SinglePlotFigure
 
@@ -50,11 +52,17 @@ if __name__ == "__main__":
     dishes: dict[str, Dish] = {
         "cyl": CylDish(radius=2.1e-2 / 2, vol=1e-6),
     }
-    for rname, rpattern in rockings.items():
-        for dname, dish in dishes.items():
-            main(
+    with ProcessPoolExecutor() as executor:
+        runs = [
+            executor.submit(
+                main,
                 name=f"{rname}_{dname}",
                 rocking=rpattern,
                 dish=dish,
                 viscosity=0.9e-3,
             )
+            for rname, rpattern in rockings.items()
+            for dname, dish in dishes.items()
+        ]
+        for run in runs:
+            run.result()
@@ -1,31 +1,52 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 import matplotlib.axes as mpla
+import numpy as np
 from lazympl.plot import Plot
 
 from .zhou2010 import Dish, LubricationLister92, RockingPattern, TimeSeries
 
 
+def _read_only(series: TimeSeries) -> TimeSeries:
+    """Protect a cached series from in-place modifications."""
+    series.times.flags.writeable = False
+    series.values.flags.writeable = False
+    return series
+
+
 @dataclass(frozen=True)
 class Experiment:
     rocking: RockingPattern
     dish: Dish
     viscosity: float
+    dtype: type[np.floating] = np.float64
 
     def fluid_flux(self, ntimes: int) -> TimeSeries:
-        flip = self.rocking.angle(ntimes)
-        return self.dish.fluid_flux(flip)
+        return _fluid_flux(self, ntimes)
 
     def shear_stress(self, ntimes: int) -> TimeSeries:
-        lub = LubricationLister92(
-            dynamic_viscosity=self.viscosity,
-            height=self.dish.fluid_height,
-            width=self.dish.cross_length,
-        )
-        flux = self.fluid_flux(ntimes)
-        return lub.shear_stress_bottom(flux)
+        return _shear_stress(self, ntimes)
+
+
+@lru_cache(maxsize=8)
+def _fluid_flux(exp: Experiment, ntimes: int) -> TimeSeries:
+    flip = exp.rocking.angle(ntimes, dtype=exp.dtype)
+    angular_vel = exp.rocking.angular_velocity(flip)
+    return _read_only(exp.dish.fluid_flux(flip, angular_vel))
+
+
+@lru_cache(maxsize=8)
+def _shear_stress(exp: Experiment, ntimes: int) -> TimeSeries:
+    lub = LubricationLister92(
+        dynamic_viscosity=exp.viscosity,
+        height=exp.dish.fluid_height,
+        width=exp.dish.cross_length,
+    )
+    flux = _fluid_flux(exp, ntimes)
+    return _read_only(lub.shear_stress_bottom(flux))
 
 
 @dataclass(frozen=True)
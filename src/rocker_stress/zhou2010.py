@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import final, override
 
@@ -12,37 +13,81 @@ from numpy.typing import NDArray
 
 @dataclass(frozen=True)
 class TimeSeries:
-    times: NDArray[np.float64]
-    values: NDArray[np.float64]
+    times: NDArray[np.floating]
+    values: NDArray[np.floating]
+    """Values, time is the last axis and leading axes index a batch of series."""
+    uniform_dt: float | None = None
+    """Time step, only set if times are uniformly spaced."""
 
-    def with_values(self, values: NDArray[np.float64]) -> TimeSeries:
+    def with_values(self, values: NDArray[np.floating]) -> TimeSeries:
         return TimeSeries(
             times=self.times,
             values=values,
+            uniform_dt=self.uniform_dt,
         )
 
     def neg(self) -> TimeSeries:
         return self.with_values(-self.values)
 
     def derivate(self) -> TimeSeries:
-        return self.with_values(np.gradient(self.values, self.times))
+        spacing = self.times if self.uniform_dt is None else self.uniform_dt
+        return self.with_values(np.gradient(self.values, spacing, axis=-1))
+
+
+def stack(series: Sequence[TimeSeries]) -> TimeSeries:
+    """Batch time series sharing the same times along a leading axis."""
+    if not series:
+        raise ValueError("no time series to stack")
+    first = series[0]
+    if not all(np.array_equal(ts.times, first.times) for ts in series[1:]):
+        raise ValueError("stacked time series must share the same times")
+    return first.with_values(np.stack([ts.values for ts in series]))
 
 
 class RockingPattern(ABC):
     @abstractmethod
-    def angle(self, ntimes: int) -> TimeSeries:
+    def angle(self, ntimes: int, dtype: type[np.floating] = np.float64) -> TimeSeries:
         """Flip angle time series."""
 
+    def angular_velocity(self, angle: TimeSeries) -> TimeSeries:
+        """Time derivative of an angle time series produced by this pattern.
+
+        Only valid for unbatched series obtained from `angle`.
+        """
+        return angle.derivate()
+
 
 @dataclass(frozen=True)
 class SineRocking(RockingPattern):
     angle_max: float
     period: float
 
-    def angle(self, ntimes: int) -> TimeSeries:
-        times = np.linspace(0.0, self.period, ntimes, dtype=np.float64)
-        values = self.angle_max * np.sin(2 * np.pi * times / self.period)
-        return TimeSeries(times=times, values=values)
+    @property
+    def _omega(self) -> float:
+        return 2 * np.pi / self.period
+
+    def _phase(self, times: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Phase at each time, in a fresh buffer of the same dtype."""
+        phase = np.empty_like(times)
+        return np.multiply(times, self._omega, out=phase)
+
+    def angle(self, ntimes: int, dtype: type[np.floating] = np.float64) -> TimeSeries:
+        times = np.linspace(0.0, self.period, ntimes, dtype=dtype)
+        values = self._phase(times)
+        np.sin(values, out=values)
+        np.multiply(values, self.angle_max, out=values)
+        return TimeSeries(
+            times=times,
+            values=values,
+            uniform_dt=self.period / (ntimes - 1) if ntimes > 1 else None,
+        )
+
+    def angular_velocity(self, angle: TimeSeries) -> TimeSeries:
+        # exact derivative, no finite difference error
+        values = self._phase(angle.times)
+        np.cos(values, out=values)
+        np.multiply(values, self.angle_max * self._omega, out=values)
+        return angle.with_values(values)
 
 
 @dataclass(frozen=True)
@@ -51,7 +96,7 @@ class ConstantRocking(RockingPattern):
     backward_angular_vel: float
     angle_max: float
 
-    def angle(self, ntimes: int) -> TimeSeries:
+    def angle(self, ntimes: int, dtype: type[np.floating] = np.float64) -> TimeSeries:
         n_fwd = int(
             self.backward_angular_vel
             / (self.backward_angular_vel + self.forward_angular_vel)
@@ -59,8 +104,8 @@ class ConstantRocking(RockingPattern):
         )
         n_back = ntimes - n_fwd
         assert n_fwd > 0 and n_back > 0
-        times = np.zeros(ntimes)
-        values = np.zeros_like(times)
+        times = np.empty(ntimes, dtype=dtype)
+        values = np.empty_like(times)
 
         dt_fwd = self.angle_max / self.forward_angular_vel
         dt_back = self.angle_max / self.backward_angular_vel
@@ -92,11 +137,37 @@ class Dish(ABC):
     def fluid_volume(self, angle: TimeSeries) -> TimeSeries:
         """Fluid volume on the right of the center of the dish."""
 
+    @abstractmethod
+    def fluid_volume_slope(self, angle: TimeSeries) -> TimeSeries:
+        """Derivative of fluid volume with respect to the flip angle.
+
+        The values must be a newly allocated writable array, `fluid_flux`
+        reuses it as its output buffer.
+        """
+
     @final
-    def fluid_flux(self, angle: TimeSeries) -> TimeSeries:
-        if np.any(np.absolute(angle.values) > self.critical_angle):
+    def fluid_flux(
+        self, angle: TimeSeries, angular_vel: TimeSeries | None = None
+    ) -> TimeSeries:
+        # reductions avoid allocating |angle| and a boolean mask
+        values = angle.values
+        max_angle = 0.0
+        if values.size > 0:
+            max_angle = max(float(values.max()), -float(values.min()))
+        if max_angle > self.critical_angle:
             raise RuntimeError(f"angle beyond critical value {self.critical_angle}")
-        return self.fluid_volume(angle).derivate().neg()
+        # chain rule, dV/dt = dV/dangle * dangle/dt
+        if angular_vel is None:
+            angular_vel = angle.derivate()
+        elif angular_vel.values.shape != angle.values.shape or not (
+            angular_vel.times is angle.times
+            or np.array_equal(angular_vel.times, angle.times)
+        ):
+            raise ValueError("angular velocity does not match angle time series")
+        # fluid_volume_slope returns a fresh array, the flux reuses its buffer
+        slope = self.fluid_volume_slope(angle).values
+        np.multiply(slope, angular_vel.values, out=slope)
+        return angle.with_values(np.negative(slope, out=slope))
 
 
 @dataclass(frozen=True)
@@ -118,14 +189,18 @@ class RectDish(Dish):
         return np.arctan(2 * self.height / self.length)
 
     def fluid_volume(self, angle: TimeSeries) -> TimeSeries:
-        vol = (
-            self.width
-            * self.length
-            / 2
-            * (self.height - self.length / 4 * np.tan(angle.values))
-        )
+        # W L / 2 * (H - L / 4 * tan(angle))
+        vol = np.tan(angle.values)
+        np.multiply(vol, -self.width * self.length**2 / 8, out=vol)
+        np.add(vol, self.width * self.length * self.height / 2, out=vol)
         return angle.with_values(vol)
 
+    def fluid_volume_slope(self, angle: TimeSeries) -> TimeSeries:
+        slope = np.cos(angle.values)
+        np.square(slope, out=slope)
+        np.divide(-self.width * self.length**2 / 8, slope, out=slope)
+        return angle.with_values(slope)
+
 
 @dataclass(frozen=True)
 class CylDish(Dish):
@@ -145,11 +220,18 @@ class CylDish(Dish):
         return np.arctan(self.fluid_height / self.radius)
 
     def fluid_volume(self, angle: TimeSeries) -> TimeSeries:
-        vol = self.radius**2 * (
-            np.pi * self.fluid_height / 2 - 2 * self.radius / 3 * np.tan(angle.values)
-        )
+        # R**2 * (pi * h / 2 - 2 R / 3 * tan(angle)), with pi R**2 h = vol
+        vol = np.tan(angle.values)
+        np.multiply(vol, -2 * self.radius**3 / 3, out=vol)
+        np.add(vol, self.vol / 2, out=vol)
         return angle.with_values(vol)
 
+    def fluid_volume_slope(self, angle: TimeSeries) -> TimeSeries:
+        slope = np.cos(angle.values)
+        np.square(slope, out=slope)
+        np.divide(-2 * self.radius**3 / 3, slope, out=slope)
+        return angle.with_values(slope)
+
 
 @dataclass(frozen=True)
 class LubricationLister92:
@@ -162,5 +244,7 @@ class LubricationLister92:
         # u(z) = 3 q / (2 b h**3) z (2h - z) = a z (2h - z)
         # Hence, du/dz = 2 a (h - z)
         # and at z = 0, du/dz = 2 a h = 3 q / (b h**2)
-        du_dz = 3 / (self.width * self.height**2) * flux.values
-        return flux.with_values(self.dynamic_viscosity * du_dz)
+        # stress = viscosity * du/dz, scalar factors are folded first
+        mu, b, h = self.dynamic_viscosity, self.width, self.height
+        coef = 3 * mu / (b * h**2)
+        return flux.with_values(np.multiply(coef, flux.values, dtype=flux.values.dtype))
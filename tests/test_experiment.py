@@ -0,0 +1,32 @@
+import numpy as np
+
+from rocker_stress.experiment import Experiment
+from rocker_stress.zhou2010 import CylDish, SineRocking
+
+
+def _experiment(dtype: type[np.floating] = np.float64) -> Experiment:
+    return Experiment(
+        rocking=SineRocking(angle_max=np.radians(5), period=10),
+        dish=CylDish(radius=2.1e-2 / 2, vol=1e-6),
+        viscosity=0.9e-3,
+        dtype=dtype,
+    )
+
+
+def test_cache_shared_by_keyword_and_positional() -> None:
+    exp = _experiment()
+    assert exp.shear_stress(ntimes=100) is exp.shear_stress(100)
+    assert exp.fluid_flux(ntimes=100) is exp.fluid_flux(100)
+
+
+def test_results_read_only() -> None:
+    exp = _experiment()
+    for series in (exp.fluid_flux(100), exp.shear_stress(100)):
+        assert not series.times.flags.writeable
+        assert not series.values.flags.writeable
+
+
+def test_float32() -> None:
+    stress = _experiment(np.float32).shear_stress(100)
+    assert stress.times.dtype == np.float32
+    assert stress.values.dtype == np.float32
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from rocker_stress.zhou2010 import (
+    ConstantRocking,
+    CylDish,
+    Dish,
+    RectDish,
+    SineRocking,
+    TimeSeries,
+    stack,
+)
+
+DISHES = [
+    CylDish(radius=2.1e-2 / 2, vol=1e-6),
+    RectDish(length=0.1, width=0.05, height=0.01),
+]
+
+
+@pytest.mark.parametrize("dish", DISHES)
+def test_fluid_volume_slope_matches_volume(dish: Dish) -> None:
+    angle = TimeSeries(
+        times=np.linspace(0.0, 1.0, 1000),
+        values=np.linspace(-0.15, 0.15, 1000),
+    )
+    slope = dish.fluid_volume_slope(angle).values
+    expected = np.gradient(dish.fluid_volume(angle).values, angle.values)
+    np.testing.assert_allclose(slope, expected, rtol=1e-4)
+
+
+def test_fluid_flux_matches_volume_derivative() -> None:
+    dish = CylDish(radius=2.1e-2 / 2, vol=1e-6)
+    rocking = ConstantRocking(
+        forward_angular_vel=np.radians(5),
+        backward_angular_vel=np.radians(1),
+        angle_max=np.radians(15),
+    )
+    angle = rocking.angle(1000)
+    expected = dish.fluid_volume(angle).derivate().neg()
+    np.testing.assert_allclose(
+        dish.fluid_flux(angle).values, expected.values, rtol=1e-3
+    )
+
+
+def test_stack_matches_individual_series() -> None:
+    dish = CylDish(radius=2.1e-2 / 2, vol=1e-6)
+    angles = [
+        SineRocking(angle_max=np.radians(amax), period=10).angle(50) for amax in (2, 5)
+    ]
+    batch = dish.fluid_flux(stack(angles))
+    assert batch.values.shape == (2, 50)
+    for flux, angle in zip(batch.values, angles):
+        np.testing.assert_allclose(flux, dish.fluid_flux(angle).values)
+
+
+def test_stack_rejects_different_times() -> None:
+    angles = [SineRocking(angle_max=0.1, period=period).angle(50) for period in (5, 10)]
+    with pytest.raises(ValueError):
+        stack(angles)
+
+
+def test_stack_rejects_empty() -> None:
+    with pytest.raises(ValueError):
+        stack([])
+
+
+def test_fluid_flux_rejects_mismatched_angular_velocity() -> None:
+    dish = CylDish(radius=2.1e-2 / 2, vol=1e-6)
+    rockings = [SineRocking(angle_max=np.radians(amax), period=10) for amax in (2, 5)]
+    batch = stack([rocking.angle(50) for rocking in rockings])
+    with pytest.raises(ValueError):
+        dish.fluid_flux(batch, rockings[0].angular_velocity(batch))
+
+
+@pytest.mark.parametrize("ntimes", [0, 1, 2])
+def test_sine_rocking_few_samples(ntimes: int) -> None:
+    dish = CylDish(radius=2.1e-2 / 2, vol=1e-6)
+    rocking = SineRocking(angle_max=0.1, period=10)
+    angle = rocking.angle(ntimes)
+    flux = dish.fluid_flux(angle, rocking.angular_velocity(angle))
+    assert flux.values.shape == (ntimes,)
+
+
+def test_derivate_uniform_dt_matches_times() -> None:
+    angle = SineRocking(angle_max=0.1, period=10).angle(100)
+    assert angle.uniform_dt is not None
+    explicit = TimeSeries(times=angle.times, values=angle.values)
+    np.testing.assert_allclose(angle.derivate().values, explicit.derivate().values)
+
+
+def test_fluid_flux_critical_angle() -> None:
+    dish = CylDish(radius=2.1e-2 / 2, vol=1e-6)
+    empty = TimeSeries(times=np.empty(0), values=np.empty(0))
+    assert dish.fluid_flux(empty, empty).values.size == 0
+    angle = SineRocking(angle_max=-2 * dish.critical_angle, period=10).angle(50)
+    with pytest.raises(RuntimeError):
+        dish.fluid_flux(angle)
+
+
+def test_sine_angular_velocity_matches_derivate() -> None:
+    rocking = SineRocking(angle_max=np.radians(5), period=10)
+    angle = rocking.angle(1000)
+    np.testing.assert_allclose(
+        rocking.angular_velocity(angle).values[1:-1],
+        angle.derivate().values[1:-1],
+        rtol=1e-4,
+        atol=1e-8,
+    )